@@ -11,21 +11,41 @@ Covers:
 - Time charter equivalent (TCE) / freight cost
 - Regas fees, pipeline tariffs
 - Simple hedge P&L (flat price hedge)
+- Numba-compiled batch kernel for scenario sweeps
+- Monte Carlo P&L over sampled price / boil-off / freight scenarios
 - CLI-ready structure via main()
 """
 
-from dataclasses import dataclass, asdict
-from typing import Literal, Dict, Any
+from dataclasses import dataclass, fields
+from enum import IntEnum
+from typing import Dict, Any, NamedTuple, Optional
 import argparse
 
+import numpy as np
+import pandas as pd
+from numba import njit, prange, types
+
 
 # -----------------------------
 # Core data structures
 # -----------------------------
 
-@dataclass
+class DealType(IntEnum):
+    # Values double as the compiled kernels' is_des flag
+    FOB = 0
+    DES = 1
+
+
+# Accepted deal_type encodings: labels, DealType members and their int codes
+_DEAL_CODES = {
+    **{d.name: int(d) for d in DealType},
+    **{int(d): int(d) for d in DealType},
+}
+
+
+@dataclass(slots=True)
 class CargoParams:
-    deal_type: Literal["FOB", "DES"]
+    deal_type: DealType
     cargo_mmbtu: float                 # Total energy of cargo
     sales_price_des: float             # DES sales price (if DES) in USD/MMBtu
     purchase_price_fob: float          # FOB purchase price (if DES) or sales price (if FOB) in USD/MMBtu
@@ -37,8 +57,16 @@ class CargoParams:
     hedge_price_usd_per_mmbtu: float   # Flat price hedge level
     hedge_volume_mmbtu: float          # Volume hedged
 
+    def __post_init__(self):
+        # Accept "FOB" / "DES" labels, DealType members and int codes; always
+        # store a DealType so downstream code can rely on .name
+        try:
+            self.deal_type = DealType(_DEAL_CODES[self.deal_type])
+        except (KeyError, TypeError):
+            raise ValueError("deal_type must be 'FOB' or 'DES'.") from None
 
-@dataclass
+
+@dataclass(slots=True)
 class ShippingParams:
     distance_nm: float                 # Nautical miles
     speed_knots: float                 # Knots
@@ -46,19 +74,49 @@ class ShippingParams:
     boiloff_rate_sea_daily: float      # Daily boil-off fraction (e.g. 0.001 = 0.1%/day)
 
 
+class LngEconResult(NamedTuple):
+    shipping_days: float
+    voyage_boiloff_mmbtu: float
+    fuel_use_mmbtu: float
+    total_losses_mmbtu: float
+    net_delivered_mmbtu: float
+    freight_cost_total_usd: float
+    regas_cost_total_usd: float
+    pipeline_cost_total_usd: float
+    gross_margin_usd: float
+    downstream_costs_usd: float
+    net_margin_usd: float
+    hedge_pnl_usd: float
+    total_pnl_usd: float
+    inputs: Optional[Dict[str, Any]] = None  # Shallow echo of cargo / shipping params
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Dict view in the original result layout ("inputs" first, if present).
+        """
+        d = self._asdict()
+        inputs = d.pop("inputs")
+        return d if inputs is None else {"inputs": inputs, **d}
+
+
 # -----------------------------
 # Helper functions
 # -----------------------------
+# Compiled so the economics kernel below can call them; they stay callable
+# from Python with scalar arguments.
 
+@njit(cache=True)
 def calc_shipping_days(distance_nm: float, speed_knots: float) -> float:
     """
     Shipping days = distance (nm) / (speed (knots) * 24 hours/day)
     """
     if speed_knots <= 0:
         raise ValueError("Speed must be positive.")
-    return distance_nm / (speed_knots * 24.0)
+    # Constant in the argument precision so float32 runs stay float32
+    return distance_nm / (speed_knots * type(speed_knots)(24.0))
 
 
+@njit(cache=True)
 def calc_voyage_boiloff(cargo_mmbtu: float, shipping_days: float, daily_boiloff_rate: float) -> float:
     """
     Approximate voyage boil-off using simple linear approximation:
@@ -68,6 +126,7 @@ def calc_voyage_boiloff(cargo_mmbtu: float, shipping_days: float, daily_boiloff_
     return cargo_mmbtu * daily_boiloff_rate * shipping_days
 
 
+@njit(cache=True)
 def calc_fuel_use(cargo_mmbtu: float, fuel_use_fraction: float) -> float:
     """
     Fuel use as a fraction of cargo.
@@ -75,6 +134,7 @@ def calc_fuel_use(cargo_mmbtu: float, fuel_use_fraction: float) -> float:
     return cargo_mmbtu * fuel_use_fraction
 
 
+@njit(cache=True)
 def calc_freight_cost(daily_charter_rate_usd: float, shipping_days: float) -> float:
     """
     Freight cost = daily charter * days.
@@ -82,6 +142,7 @@ def calc_freight_cost(daily_charter_rate_usd: float, shipping_days: float) -> fl
     return daily_charter_rate_usd * shipping_days
 
 
+@njit(cache=True)
 def calc_hedge_pnl(
     hedge_price: float,
     physical_price: float,
@@ -96,97 +157,422 @@ def calc_hedge_pnl(
 
 
 # -----------------------------
-# Main economics function
+# Compiled economics kernel
 # -----------------------------
 
-def lng_cargo_economics(
-    cargo: CargoParams,
-    shipping: ShippingParams
-) -> Dict[str, Any]:
+# Kernel argument order (one row per field in the batch input matrix)
+CARGO_KERNEL_FIELDS = (
+    "cargo_mmbtu",
+    "sales_price_des",
+    "purchase_price_fob",
+    "fuel_use_fraction_of_cargo",
+    "freight_deduct_usd_per_mmbtu",
+    "regas_fee_usd_per_mmbtu",
+    "pipeline_tariff_usd_per_mmbtu",
+    "hedge_price_usd_per_mmbtu",
+    "hedge_volume_mmbtu",
+)
+SHIPPING_KERNEL_FIELDS = (
+    "distance_nm",
+    "speed_knots",
+    "daily_charter_rate_usd",
+    "boiloff_rate_sea_daily",
+)
+KERNEL_INPUT_FIELDS = CARGO_KERNEL_FIELDS + SHIPPING_KERNEL_FIELDS
+
+# Kernel output order
+RESULT_FIELDS = tuple(f for f in LngEconResult._fields if f != "inputs")
+
+_N_IN = len(KERNEL_INPUT_FIELDS)
+_N_OUT = len(RESULT_FIELDS)
+
+# Only the float64 scalar kernels used by lng_cargo_economics are compiled at
+# import; batch, Monte Carlo and float32 variants compile lazily on first call
+# and are reloaded from the on-disk cache afterwards
+_SCALAR_SIGNATURE = types.UniTuple(types.float64, _N_OUT)(*([types.float64] * _N_IN))
+_SUPPORTED_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+
+def _make_econ_kernel(des: bool):
     """
-    Compute LNG cargo P&L for FOB or DES structure.
-    Returns a dict with detailed components.
+    Build a scalar P&L kernel with the deal-type branch resolved up front.
+    Numba freezes the closed-over flag as a constant, so the other deal
+    structure is pruned from the compiled code. The boil-off -> fuel ->
+    delivered -> regas/pipeline chain is one scalar pass per scenario, so
+    batch loops keep every intermediate in registers.
     """
+    @njit(cache=True)
+    def kernel(
+        cargo_mmbtu,
+        sales_price_des,
+        purchase_price_fob,
+        fuel_use_fraction_of_cargo,
+        freight_deduct_usd_per_mmbtu,
+        regas_fee_usd_per_mmbtu,
+        pipeline_tariff_usd_per_mmbtu,
+        hedge_price_usd_per_mmbtu,
+        hedge_volume_mmbtu,
+        distance_nm,
+        speed_knots,
+        daily_charter_rate_usd,
+        boiloff_rate_sea_daily,
+    ):
+        # Constant in the argument precision so float32 runs stay float32
+        zero = type(cargo_mmbtu)(0.0)
+
+        # 1) Shipping days and freight
+        shipping_days = calc_shipping_days(distance_nm, speed_knots)
+        freight_cost_total = calc_freight_cost(daily_charter_rate_usd, shipping_days)
+
+        # 2) Boil-off and fuel use
+        voyage_boiloff_mmbtu = calc_voyage_boiloff(cargo_mmbtu, shipping_days, boiloff_rate_sea_daily)
+        fuel_use_mmbtu = calc_fuel_use(cargo_mmbtu, fuel_use_fraction_of_cargo)
+
+        total_losses_mmbtu = voyage_boiloff_mmbtu + fuel_use_mmbtu
+        net_delivered_mmbtu = max(cargo_mmbtu - total_losses_mmbtu, zero)
+
+        # 3) Regas + pipeline costs (applied on delivered volume)
+        regas_cost_total = net_delivered_mmbtu * regas_fee_usd_per_mmbtu
+        pipeline_cost_total = net_delivered_mmbtu * pipeline_tariff_usd_per_mmbtu
+        downstream_costs = regas_cost_total + pipeline_cost_total
 
-    # 1) Shipping days and freight
-    shipping_days = calc_shipping_days(shipping.distance_nm, shipping.speed_knots)
-    freight_cost_total = calc_freight_cost(shipping.daily_charter_rate_usd, shipping_days)
+        # 4) Revenue and cost depending on deal type
+        if des:
+            # Buy FOB, sell DES, freight cost is explicit
+            fob_cost_total = cargo_mmbtu * purchase_price_fob
+            des_revenue_total = net_delivered_mmbtu * sales_price_des
+            gross_margin = des_revenue_total - fob_cost_total - freight_cost_total
+            physical_price_for_hedge = sales_price_des  # hedge vs DES price
+        else:
+            # Sell FOB, freight_deduct_usd_per_mmbtu is the notional freight for netback
+            fob_revenue_total = cargo_mmbtu * purchase_price_fob
+            freight_deduct_total = cargo_mmbtu * freight_deduct_usd_per_mmbtu
+            gross_margin = fob_revenue_total - freight_deduct_total - freight_cost_total
+            physical_price_for_hedge = purchase_price_fob - freight_deduct_usd_per_mmbtu
 
-    # 2) Boil-off and fuel use
-    voyage_boiloff_mmbtu = calc_voyage_boiloff(
-        cargo.cargo_mmbtu,
-        shipping_days,
-        shipping.boiloff_rate_sea_daily
+        net_margin = gross_margin - downstream_costs
+
+        # 5) Hedge P&L
+        hedge_pnl = calc_hedge_pnl(hedge_price_usd_per_mmbtu, physical_price_for_hedge, hedge_volume_mmbtu)
+
+        total_pnl = net_margin + hedge_pnl
+
+        return (
+            shipping_days,
+            voyage_boiloff_mmbtu,
+            fuel_use_mmbtu,
+            total_losses_mmbtu,
+            net_delivered_mmbtu,
+            freight_cost_total,
+            regas_cost_total,
+            pipeline_cost_total,
+            gross_margin,
+            downstream_costs,
+            net_margin,
+            hedge_pnl,
+            total_pnl,
+        )
+
+    kernel.compile(_SCALAR_SIGNATURE)
+    return kernel
+
+
+_econ_des = _make_econ_kernel(True)
+_econ_fob = _make_econ_kernel(False)
+
+
+@njit(cache=True)
+def _econ_kernel(
+    cargo_mmbtu,
+    sales_price_des,
+    purchase_price_fob,
+    fuel_use_fraction_of_cargo,
+    freight_deduct_usd_per_mmbtu,
+    regas_fee_usd_per_mmbtu,
+    pipeline_tariff_usd_per_mmbtu,
+    hedge_price_usd_per_mmbtu,
+    hedge_volume_mmbtu,
+    distance_nm,
+    speed_knots,
+    daily_charter_rate_usd,
+    boiloff_rate_sea_daily,
+    is_des,
+):
+    """
+    Scalar P&L for one cargo; is_des is 1 for DES, 0 for FOB.
+    Returns the components in RESULT_FIELDS order.
+    """
+    if is_des:
+        return _econ_des(
+            cargo_mmbtu, sales_price_des, purchase_price_fob,
+            fuel_use_fraction_of_cargo, freight_deduct_usd_per_mmbtu,
+            regas_fee_usd_per_mmbtu, pipeline_tariff_usd_per_mmbtu,
+            hedge_price_usd_per_mmbtu, hedge_volume_mmbtu,
+            distance_nm, speed_knots, daily_charter_rate_usd, boiloff_rate_sea_daily,
+        )
+    return _econ_fob(
+        cargo_mmbtu, sales_price_des, purchase_price_fob,
+        fuel_use_fraction_of_cargo, freight_deduct_usd_per_mmbtu,
+        regas_fee_usd_per_mmbtu, pipeline_tariff_usd_per_mmbtu,
+        hedge_price_usd_per_mmbtu, hedge_volume_mmbtu,
+        distance_nm, speed_knots, daily_charter_rate_usd, boiloff_rate_sea_daily,
     )
-    fuel_use_mmbtu = calc_fuel_use(cargo.cargo_mmbtu, cargo.fuel_use_fraction_of_cargo)
 
-    total_losses_mmbtu = voyage_boiloff_mmbtu + fuel_use_mmbtu
-    net_delivered_mmbtu = max(cargo.cargo_mmbtu - total_losses_mmbtu, 0.0)
 
-    # 3) Regas + pipeline costs (applied on delivered volume)
-    regas_cost_total = net_delivered_mmbtu * cargo.regas_fee_usd_per_mmbtu
-    pipeline_cost_total = net_delivered_mmbtu * cargo.pipeline_tariff_usd_per_mmbtu
+def _make_econ_batch(des: bool):
+    """
+    Build a parallel batch runner for a single deal type (no per-row branch).
+    """
+    @njit(parallel=True, cache=True)
+    def batch(x):
+        n = x.shape[1]
+        out = np.empty((_N_OUT, n), dtype=x.dtype)
+        for i in prange(n):
+            if des:
+                r = _econ_des(
+                    x[0, i], x[1, i], x[2, i], x[3, i], x[4, i], x[5, i], x[6, i],
+                    x[7, i], x[8, i], x[9, i], x[10, i], x[11, i], x[12, i],
+                )
+            else:
+                r = _econ_fob(
+                    x[0, i], x[1, i], x[2, i], x[3, i], x[4, i], x[5, i], x[6, i],
+                    x[7, i], x[8, i], x[9, i], x[10, i], x[11, i], x[12, i],
+                )
+            for j in range(_N_OUT):
+                out[j, i] = r[j]
+        return out
+
+    return batch
+
+
+@njit(parallel=True, cache=True)
+def _econ_batch(x, is_des):
+    """
+    Run _econ_kernel over N mixed-deal-type scenarios in parallel.
+    x is (len(KERNEL_INPUT_FIELDS), N); returns (len(RESULT_FIELDS), N).
+    """
+    n = is_des.shape[0]
+    out = np.empty((_N_OUT, n), dtype=x.dtype)
+    for i in prange(n):
+        r = _econ_kernel(
+            x[0, i], x[1, i], x[2, i], x[3, i], x[4, i], x[5, i], x[6, i],
+            x[7, i], x[8, i], x[9, i], x[10, i], x[11, i], x[12, i],
+            is_des[i],
+        )
+        for j in range(_N_OUT):
+            out[j, i] = r[j]
+    return out
+
 
-    # 4) Revenue and cost depending on deal type
-    if cargo.deal_type == "DES":
-        # Buy FOB, sell DES
-        fob_cost_total = cargo.cargo_mmbtu * cargo.purchase_price_fob
-        des_revenue_total = net_delivered_mmbtu * cargo.sales_price_des
+# Deal type -> specialized scalar kernel / batch runner, dispatched once per call
+_ECON_IMPL = {DealType.DES: _econ_des, DealType.FOB: _econ_fob}
+_ECON_BATCH_IMPL = {DealType.DES: _make_econ_batch(True), DealType.FOB: _make_econ_batch(False)}
 
-        # Freight cost is explicit
-        # Optional freight deduct notionally embedded in DES price can be tracked separately if desired
-        gross_margin = des_revenue_total - fob_cost_total - freight_cost_total
-        downstream_costs = regas_cost_total + pipeline_cost_total
-        net_margin = gross_margin - downstream_costs
 
-        physical_price_for_hedge = cargo.sales_price_des  # hedge vs DES price
+# -----------------------------
+# Vectorized economics (struct-of-arrays batch)
+# -----------------------------
+
+def _des_mask(deal_type) -> np.ndarray:
+    """
+    Boolean DES mask from "FOB" / "DES" labels, DealType members or int
+    codes, in any array dtype (including object arrays and Series).
+    """
+    deal_type = np.asarray(deal_type)
+    if deal_type.dtype.kind in "iub":
+        codes = deal_type
+    else:
+        mapped = pd.Series(deal_type.ravel()).map(_DEAL_CODES)
+        if mapped.isna().any():
+            raise ValueError("deal_type must be 'FOB' or 'DES'.")
+        codes = mapped.to_numpy(dtype=np.int64).reshape(deal_type.shape)
+    is_des = codes == DealType.DES
+    if not np.all(is_des | (codes == DealType.FOB)):
+        raise ValueError("deal_type must be 'FOB' or 'DES'.")
+    return is_des
 
-    elif cargo.deal_type == "FOB":
-        # Sell FOB, buyer lifts and pays freight
-        # Here freight_deduct_usd_per_mmbtu is used as a notional freight to compute netback
-        fob_revenue_total = cargo.cargo_mmbtu * cargo.purchase_price_fob
-        freight_deduct_total = cargo.cargo_mmbtu * cargo.freight_deduct_usd_per_mmbtu
-        netback_total = fob_revenue_total - freight_deduct_total
 
-        # If you still want to model shipping yourself (e.g. portfolio shipping),
-        # you can treat freight_cost_total as your actual freight and compare vs deduct.
-        gross_margin = netback_total - freight_cost_total
-        downstream_costs = regas_cost_total + pipeline_cost_total
-        net_margin = gross_margin - downstream_costs
+def _kernel_dtype(dtype) -> np.dtype:
+    """
+    Validate the float precision requested for a batch run.
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in _SUPPORTED_DTYPES:
+        raise ValueError("dtype must be float32 or float64.")
+    return dtype
+
+
+def lng_cargo_economics_vec(
+    cargo_arrays: Dict[str, np.ndarray],
+    shipping_arrays: Dict[str, np.ndarray],
+    deal_type: np.ndarray,
+    dtype: np.dtype = np.float64
+) -> Dict[str, np.ndarray]:
+    """
+    Compute LNG cargo P&L for N scenarios at once.
+
+    cargo_arrays / shipping_arrays map the numeric CargoParams / ShippingParams
+    field names to arrays (scalars broadcast); deal_type is an array of
+    DealType codes or "FOB" / "DES" labels. Inputs are packed into one
+    contiguous matrix and run through the compiled batch kernel;
+    single-deal-type batches use the specialized runner for that deal type.
+    dtype sets the working precision. The float64 default matches
+    lng_cargo_economics exactly. np.float32 is an opt-in for large sweeps:
+    it halves memory traffic, but USD figures carry errors of ~1e-6 of the
+    cargo notional (up to ~$15 per 3M MMBtu cargo), so most rows differ
+    from float64 at cent precision.
+    Returns a dict of ndarrays keyed like lng_cargo_economics.
+    """
+    dtype = _kernel_dtype(dtype)
+    arrays = {**cargo_arrays, **shipping_arrays}
+    values = [np.asarray(arrays[k]) for k in KERNEL_INPUT_FIELDS]
+
+    is_des = _des_mask(deal_type)
 
-        physical_price_for_hedge = cargo.purchase_price_fob - cargo.freight_deduct_usd_per_mmbtu
+    # Broadcast-assign each field straight into its row: one pass, no per-field temporaries
+    shape = np.broadcast_shapes(is_des.shape, *(v.shape for v in values))
+    x = np.empty((_N_IN, int(np.prod(shape))), dtype=dtype)
+    rows = x.reshape((_N_IN,) + shape)
+    for k, v in enumerate(values):
+        rows[k] = v
 
+    if np.any(x[KERNEL_INPUT_FIELDS.index("speed_knots")] <= 0):
+        raise ValueError("Speed must be positive.")
+
+    if is_des.all():
+        out = _ECON_BATCH_IMPL[DealType.DES](x)
+    elif not is_des.any():
+        out = _ECON_BATCH_IMPL[DealType.FOB](x)
     else:
+        flags = np.ascontiguousarray(np.broadcast_to(is_des, shape).ravel(), dtype=np.int8)
+        out = _econ_batch(x, flags)
+    return {k: out[j].reshape(shape) for j, k in enumerate(RESULT_FIELDS)}
+
+
+# -----------------------------
+# Main economics function
+# -----------------------------
+
+def lng_cargo_economics(
+    cargo: CargoParams,
+    shipping: ShippingParams,
+    include_inputs: bool = True
+) -> LngEconResult:
+    """
+    Compute LNG cargo P&L for FOB or DES structure.
+    Dispatches once on deal_type to the specialized compiled kernel.
+    Returns an LngEconResult with detailed (unrounded) components; the
+    inputs echo is a shallow copy of the parameters and is left as None
+    when include_inputs is False. Use .as_dict() for the dict layout.
+    """
+    impl = _ECON_IMPL.get(cargo.deal_type)
+    if impl is None:
         raise ValueError("deal_type must be 'FOB' or 'DES'.")
+    if shipping.speed_knots <= 0:
+        raise ValueError("Speed must be positive.")
+
+    # Cast to float so int inputs hit the precompiled float64 kernel
+    args = [float(getattr(cargo, k)) for k in CARGO_KERNEL_FIELDS]
+    args += [float(getattr(shipping, k)) for k in SHIPPING_KERNEL_FIELDS]
+    values = impl(*args)
+
+    inputs = None
+    if include_inputs:
+        cargo_inputs = {f.name: getattr(cargo, f.name) for f in fields(cargo)}
+        cargo_inputs["deal_type"] = cargo.deal_type.name  # echo the label, not the int code
+        inputs = {
+            "cargo": cargo_inputs,
+            "shipping": {f.name: getattr(shipping, f.name) for f in fields(shipping)},
+        }
+    return LngEconResult(*values, inputs=inputs)
 
-    # 5) Hedge P&L
-    hedge_pnl = calc_hedge_pnl(
-        hedge_price=cargo.hedge_price_usd_per_mmbtu,
-        physical_price=physical_price_for_hedge,
-        hedge_volume=cargo.hedge_volume_mmbtu
+
+# -----------------------------
+# Monte Carlo
+# -----------------------------
+
+@njit(parallel=True, cache=True)
+def mc_lng_pnl(cargo_arr, shipping_arr, is_des):
+    """
+    Total P&L per scenario, in parallel over scenarios.
+    cargo_arr is (N, len(CARGO_KERNEL_FIELDS)), shipping_arr is
+    (N, len(SHIPPING_KERNEL_FIELDS)), is_des is 1 for DES, 0 for FOB.
+    Raises ValueError on mismatched shapes (compiled code does no bounds checks).
+    """
+    n = is_des.shape[0]
+    if cargo_arr.shape[0] != n or shipping_arr.shape[0] != n:
+        raise ValueError("cargo_arr, shipping_arr and is_des must have the same number of rows.")
+    if cargo_arr.shape[1] != len(CARGO_KERNEL_FIELDS) or shipping_arr.shape[1] != len(SHIPPING_KERNEL_FIELDS):
+        raise ValueError("cargo_arr / shipping_arr must have one column per kernel field.")
+    out = np.empty(n, dtype=cargo_arr.dtype)
+    for i in prange(n):
+        c = cargo_arr[i]
+        s = shipping_arr[i]
+        out[i] = _econ_kernel(
+            c[0], c[1], c[2], c[3], c[4], c[5], c[6], c[7], c[8],
+            s[0], s[1], s[2], s[3],
+            is_des[i],
+        )[_N_OUT - 1]
+    return out
+
+
+def sample_scenarios(
+    cargo: CargoParams,
+    shipping: ShippingParams,
+    n: int,
+    rng: np.random.Generator,
+    price_vol: float = 0.25,
+    price_corr: float = 0.8,
+    boiloff_rel_sd: float = 0.2,
+    charter_rel_sd: float = 0.3
+) -> pd.DataFrame:
+    """
+    Draw n scenarios around a base cargo / shipping case.
+    - DES and FOB prices: mean-preserving lognormal shocks with vol price_vol,
+      correlated at price_corr
+    - Daily boil-off and charter rate: normal shocks (relative sd), floored at 0
+    - All other fields stay at the base case
+    Returns one row per scenario with CargoParams / ShippingParams columns.
+    """
+    samples = {f.name: np.full(n, getattr(cargo, f.name)) for f in fields(cargo)}
+    samples.update({f.name: np.full(n, getattr(shipping, f.name), dtype=np.float64)
+                    for f in fields(shipping)})
+
+    z_des, z_other = rng.standard_normal((2, n))
+    z_fob = price_corr * z_des + np.sqrt(1.0 - price_corr ** 2) * z_other
+    drift = -0.5 * price_vol ** 2
+    samples["sales_price_des"] = cargo.sales_price_des * np.exp(drift + price_vol * z_des)
+    samples["purchase_price_fob"] = cargo.purchase_price_fob * np.exp(drift + price_vol * z_fob)
+
+    samples["boiloff_rate_sea_daily"] = np.maximum(
+        shipping.boiloff_rate_sea_daily * (1.0 + boiloff_rel_sd * rng.standard_normal(n)), 0.0
     )
+    samples["daily_charter_rate_usd"] = np.maximum(
+        shipping.daily_charter_rate_usd * (1.0 + charter_rel_sd * rng.standard_normal(n)), 0.0
+    )
+    return pd.DataFrame(samples)
 
-    total_pnl = net_margin + hedge_pnl
-
-    return {
-        "inputs": {
-            "cargo": asdict(cargo),
-            "shipping": asdict(shipping),
-        },
-        "shipping_days": round(shipping_days, 3),
-        "voyage_boiloff_mmbtu": round(voyage_boiloff_mmbtu, 2),
-        "fuel_use_mmbtu": round(fuel_use_mmbtu, 2),
-        "total_losses_mmbtu": round(total_losses_mmbtu, 2),
-        "net_delivered_mmbtu": round(net_delivered_mmbtu, 2),
-        "freight_cost_total_usd": round(freight_cost_total, 2),
-        "regas_cost_total_usd": round(regas_cost_total, 2),
-        "pipeline_cost_total_usd": round(pipeline_cost_total, 2),
-        "gross_margin_usd": round(gross_margin, 2),
-        "downstream_costs_usd": round(downstream_costs, 2),
-        "net_margin_usd": round(net_margin, 2),
-        "hedge_pnl_usd": round(hedge_pnl, 2),
-        "total_pnl_usd": round(total_pnl, 2),
-    }
+
+def lng_cargo_economics_mc(
+    samples: pd.DataFrame,
+    dtype: np.dtype = np.float64
+) -> np.ndarray:
+    """
+    Total P&L for each row of samples (see sample_scenarios for the layout).
+    Columns are gathered into contiguous (N, k) blocks of dtype and run
+    through mc_lng_pnl. float64 by default; np.float32 is an opt-in that
+    halves memory traffic at errors of ~1e-6 of the cargo notional (up to
+    ~$15 per 3M MMBtu cargo).
+    """
+    dtype = _kernel_dtype(dtype)
+    is_des = _des_mask(samples["deal_type"].to_numpy())
+
+    cargo_arr = np.ascontiguousarray(samples[list(CARGO_KERNEL_FIELDS)].to_numpy(dtype=dtype))
+    shipping_arr = np.ascontiguousarray(samples[list(SHIPPING_KERNEL_FIELDS)].to_numpy(dtype=dtype))
+    if np.any(shipping_arr[:, SHIPPING_KERNEL_FIELDS.index("speed_knots")] <= 0):
+        raise ValueError("Speed must be positive.")
+
+    return mc_lng_pnl(cargo_arr, shipping_arr, is_des.astype(np.int8))
 
 
 # -----------------------------
@@ -197,7 +583,7 @@ def build_arg_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="LNG Cargo Economics & P&L Model")
 
     # Deal / cargo
-    p.add_argument("--deal_type", choices=["FOB", "DES"], required=True)
+    p.add_argument("--deal_type", choices=[d.name for d in DealType], required=True)
     p.add_argument("--cargo_mmbtu", type=float, required=True)
     p.add_argument("--sales_price_des", type=float, default=12.0)
     p.add_argument("--purchase_price_fob", type=float, default=10.0)
@@ -218,12 +604,15 @@ def build_arg_parser() -> argparse.ArgumentParser:
     return p
 
 
+# Built once at import; main() may be re-entered (tests, notebooks)
+_PARSER = build_arg_parser()
+
+
 def main():
-    parser = build_arg_parser()
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
 
     cargo = CargoParams(
-        deal_type=args.deal_type,
+        deal_type=DealType[args.deal_type],
         cargo_mmbtu=args.cargo_mmbtu,
         sales_price_des=args.sales_price_des,
         purchase_price_fob=args.purchase_price_fob,
@@ -246,10 +635,11 @@ def main():
     result = lng_cargo_economics(cargo, shipping)
 
     print("=== LNG Cargo Economics & P&L ===")
-    for k, v in result.items():
+    for k, v in result.as_dict().items():
         if isinstance(v, dict):
             continue
-        print(f"{k}: {v}")
+        # Values are unrounded; precision is a display concern only
+        print(f"{k}: {v:.3f}" if k == "shipping_days" else f"{k}: {v:.2f}")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,14 @@
 import argparse
-import yfinance as yf
+import hashlib
+import os
+import tempfile
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-
-plt.style.use("seaborn-v0_8")
+import bottleneck as bn
 
 DEFAULT_TICKERS = {
     "JKM": "JKM=F",
@@ -13,40 +17,100 @@ DEFAULT_TICKERS = {
     "Brent": "BZ=F",
 }
 
+CACHE_DIR = Path.home() / ".cache" / "ca_desk"
+
+def download_prices(tickers, period):
+    # yfinance (requests, lxml, bs4) is only imported on a cache miss
+    import yfinance as yf
+
+    # One batched, threaded download instead of a request per ticker
+    names = {ticker: name for name, ticker in tickers.items()}
+    raw = yf.download(list(names), period=period, threads=True,
+                      progress=False, auto_adjust=True)["Close"]
+    return raw.rename(columns=names)[list(tickers)].dropna()
+
+@lru_cache(maxsize=None)
+def _cached_prices(items, period, day):
+    # Parquet cache keyed by (ticker set, period, day); lru_cache skips the read in-process
+    key = hashlib.sha1(repr(items).encode() + period.encode() + day.encode()).hexdigest()
+    path = CACHE_DIR / f"prices_{key}.parquet"
+    if path.exists():
+        try:
+            return pd.read_parquet(path)
+        except (OSError, ValueError):
+            pass  # unreadable cache file: download again and overwrite it
+    prices = download_prices(dict(items), period)
+    if not prices.empty:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename, so readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        os.close(fd)
+        try:
+            prices.to_parquet(tmp, compression="zstd")
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    return prices
+
 def fetch_prices(tickers, period):
-    frames = []
-    for name, ticker in tickers.items():
-        df = yf.Ticker(ticker).history(period=period)["Close"].rename(name)
-        frames.append(df)
-    return pd.concat(frames, axis=1).dropna()
+    prices = _cached_prices(tuple(sorted(tickers.items())), period, date.today().isoformat())
+    # Column selection returns a new frame, so callers never mutate the cached one
+    return prices[list(tickers)]
+
+SPREAD_LEGS = {
+    "JKM - TTF": ("JKM", "TTF"),
+    "JKM - NBP": ("JKM", "NBP"),
+    "TTF - NBP": ("TTF", "NBP"),
+    "JKM - Brent (slope)": ("JKM", "Brent"),
+}
 
 def compute_spreads(prices):
-    spreads = pd.DataFrame(index=prices.index)
-    spreads["JKM - TTF"] = prices["JKM"] - prices["TTF"]
-    spreads["JKM - NBP"] = prices["JKM"] - prices["NBP"]
-    spreads["TTF - NBP"] = prices["TTF"] - prices["NBP"]
-    spreads["JKM - Brent (slope)"] = prices["JKM"] - prices["Brent"]
-    return spreads
-
-def compute_vol(prices, window):
-    returns = prices.pct_change()
-    return returns.rolling(window).std() * np.sqrt(252)
+    # All spreads in one (N, k) array subtraction
+    left = prices[[a for a, _ in SPREAD_LEGS.values()]].to_numpy()
+    right = prices[[b for _, b in SPREAD_LEGS.values()]].to_numpy()
+    return pd.DataFrame(left - right, index=prices.index, columns=list(SPREAD_LEGS))
+
+def compute_vol(returns, window):
+    # bottleneck's C moving std; like rolling().std(), NaN until `window` valid obs
+    if window < 1:
+        raise ValueError("window must be a positive number of days.")
+    r = returns.to_numpy(dtype=np.float64, copy=False)
+    if window < 2 or window > len(r):
+        # Sample std of one observation is undefined, and move_std raises when
+        # the window exceeds the history: all NaN, like rolling().std()
+        vol = np.full(r.shape, np.nan)
+    else:
+        vol = bn.move_std(r, window=window, axis=0, ddof=1) * np.sqrt(252)
+    return pd.DataFrame(vol, index=returns.index, columns=returns.columns)
+
+def compute_corr(returns):
+    # Drop NaN rows once, then one corrcoef pass over the contiguous (N, k) block
+    r = returns.dropna().to_numpy(dtype=np.float64)
+    return pd.DataFrame(np.corrcoef(r, rowvar=False),
+                        index=returns.columns, columns=returns.columns)
 
 def run_dashboard(period, window):
     prices = fetch_prices(DEFAULT_TICKERS, period)
     spreads = compute_spreads(prices)
-    vol = compute_vol(prices, window)
-    corr = prices.pct_change().corr()
+    returns = prices.pct_change()
+    vol = compute_vol(returns, window)
+    corr = compute_corr(returns)
 
     return prices, spreads, vol, corr
 
-if __name__ == "__main__":
+def build_arg_parser():
     parser = argparse.ArgumentParser(description="LNG Analytics Dashboard")
     parser.add_argument("--period", type=str, default="24mo",
                         help="History period (e.g., 12mo, 24mo, 5y)")
     parser.add_argument("--window", type=int, default=30,
                         help="Rolling volatility window")
-    args = parser.parse_args()
+    return parser
+
+_PARSER = build_arg_parser()
+
+if __name__ == "__main__":
+    args = _PARSER.parse_args()
 
     prices, spreads, vol, corr = run_dashboard(args.period, args.window)
 